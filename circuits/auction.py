@@ -56,7 +56,7 @@ class SecondPriceAuction:
             bits.append(b)
 
         # bits[i] is LSB-first; comparison needs MSB-first
-        bits_msb = [list(reversed(b)) for b in bits]
+        bits_msb = [b[::-1] for b in bits]
 
         # Step 2: Pairwise comparisons
         # cmp[i][j] = [party_i > party_j] for i < j
@@ -160,19 +160,17 @@ class SecondPriceAuction:
 
         # Step 6: Compute second price value
         # [sp] = sum_i [bid_i] * [is_second_i]
-        sp_terms = []
-        for i in range(m):
-            term = await self.mpc.multiply(shares[i], is_second[i], f"sp_{parties[i]}")
-            sp_terms.append(term)
+        # The m products are independent, so they run as one batch (one ACS)
+        sp_terms = await self.mpc.multiply_batch(
+            [(shares[i], is_second[i]) for i in range(m)], "sp")
         second_price = sp_terms[0]
         for i in range(1, m):
             second_price = self.mpc.add(second_price, sp_terms[i])
 
         # Step 7: Output masking — each party gets is_max * second_price or 0
-        outputs = {}
-        for idx, pid in enumerate(parties):
-            outputs[pid] = await self.mpc.multiply(
-                is_max[idx], second_price, f"out_{pid}")
+        out_shares = await self.mpc.multiply_batch(
+            [(is_max[idx], second_price) for idx in range(m)], "out")
+        outputs = dict(zip(parties, out_shares))
 
         # Step 8: Output privacy via mask-and-open
         if self.party_id in active_set:
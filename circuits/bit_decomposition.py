@@ -9,20 +9,25 @@ from core.polynomial import Polynomial
 from protocols.mpc_arithmetic import MPCArithmetic
 
 
-def preprocess_random_bit_sharings(n: int, f: int, count: int) -> list[dict[int, FieldElement]]:
+def preprocess_random_bit_sharings(n: int, f: int, count: int,
+                                   gen: rng.DeterministicRNG | None = None
+                                   ) -> list[dict[int, FieldElement]]:
     """Preprocessing: generate `count` random bit sharings.
 
     Each sharing is a degree-f polynomial with p(0) ∈ {0, 1}.
     Returns list of dicts: [{party_id: share}, ...].
+    Randomness comes from gen if given, else from the global rng.
 
     In a real protocol, this would use beacon + CSS for joint generation.
     Here we simulate the ideal preprocessing functionality.
     """
+    randbelow = gen.randbelow if gen is not None else rng.randbelow
+    points = [FieldElement(i) for i in range(1, n + 1)]
     result = []
     for _ in range(count):
-        bit = rng.randbelow(2)
-        poly = Polynomial.random(degree=f, constant=FieldElement(bit))
-        shares = {i: poly.evaluate(FieldElement(i)) for i in range(1, n + 1)}
+        bit = randbelow(2)
+        poly = Polynomial.random(degree=f, constant=FieldElement(bit), gen=gen)
+        shares = dict(zip(range(1, n + 1), poly.evaluate_many(points)))
         result.append(shares)
     return result
 
@@ -1,5 +1,5 @@
 """Core primitives: field arithmetic, polynomials, deterministic RNG."""
 
-from core.field import FieldElement, PRIME
+from core.field import FieldElement, PRIME, party_points
 from core.polynomial import Polynomial, lagrange_coefficients_at_zero
 from core import rng
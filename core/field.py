@@ -1,5 +1,7 @@
 """Finite field arithmetic over F_p where p = 2^127 - 1 (Mersenne prime)."""
 
+from functools import lru_cache
+
 from core import rng
 
 PRIME = (1 << 127) - 1  # 2^127 - 1
@@ -15,32 +17,32 @@ class FieldElement:
 
     def __add__(self, other):
         if isinstance(other, int):
-            other = FieldElement(other)
-        return FieldElement((self.value + other.value) % PRIME)
+            return _fe((self.value + other) % PRIME)
+        return _fe((self.value + other.value) % PRIME)
 
     def __radd__(self, other):
         if isinstance(other, int):
-            return FieldElement((other + self.value) % PRIME)
+            return _fe((other + self.value) % PRIME)
         return NotImplemented
 
     def __sub__(self, other):
         if isinstance(other, int):
-            other = FieldElement(other)
-        return FieldElement((self.value - other.value) % PRIME)
+            return _fe((self.value - other) % PRIME)
+        return _fe((self.value - other.value) % PRIME)
 
     def __rsub__(self, other):
         if isinstance(other, int):
-            return FieldElement((other - self.value) % PRIME)
+            return _fe((other - self.value) % PRIME)
         return NotImplemented
 
     def __mul__(self, other):
         if isinstance(other, int):
-            other = FieldElement(other)
-        return FieldElement((self.value * other.value) % PRIME)
+            return _fe((self.value * other) % PRIME)
+        return _fe((self.value * other.value) % PRIME)
 
     def __rmul__(self, other):
         if isinstance(other, int):
-            return FieldElement((other * self.value) % PRIME)
+            return _fe((other * self.value) % PRIME)
         return NotImplemented
 
     def __truediv__(self, other):
@@ -49,7 +51,7 @@ class FieldElement:
         return self * other.inverse()
 
     def __neg__(self):
-        return FieldElement((-self.value) % PRIME)
+        return _fe((-self.value) % PRIME)
 
     def __pow__(self, exp):
         if isinstance(exp, FieldElement):
@@ -73,19 +75,20 @@ class FieldElement:
         return self.value != 0
 
     def inverse(self):
-        """Multiplicative inverse via Fermat's little theorem: a^{p-2} mod p."""
+        """Multiplicative inverse, computed by pow(a, -1, p) (extended gcd in C)."""
         if self.value == 0:
             raise ZeroDivisionError("Cannot invert zero")
-        return FieldElement(pow(self.value, PRIME - 2, PRIME))
+        return _fe(pow(self.value, -1, PRIME))
 
     def to_int(self):
         """Return the integer value (valid for small values like bids in [0, 32))."""
         return self.value
 
     @staticmethod
-    def random():
-        """Return a random non-zero field element."""
-        return FieldElement(rng.randbelow(PRIME - 1) + 1)
+    def random(gen: rng.DeterministicRNG | None = None):
+        """Return a random non-zero field element, drawn from gen if given."""
+        randbelow = gen.randbelow if gen is not None else rng.randbelow
+        return FieldElement(randbelow(PRIME - 1) + 1)
 
     @staticmethod
     def random_including_zero():
@@ -99,3 +102,19 @@ class FieldElement:
     @staticmethod
     def one():
         return FieldElement(1)
+
+
+_new = object.__new__
+
+
+def _fe(value: int) -> FieldElement:
+    """Wrap an int already reduced mod PRIME, skipping __init__'s reduction."""
+    e = _new(FieldElement)
+    e.value = value
+    return e
+
+
+@lru_cache(maxsize=None)
+def party_points(n: int) -> tuple[FieldElement, ...]:
+    """Party ids 0..n as field elements, indexed by id (built once per n)."""
+    return tuple(FieldElement(i) for i in range(n + 1))
@@ -1,6 +1,9 @@
 """Polynomial operations and Lagrange interpolation over F_p."""
 
-from core.field import FieldElement
+from functools import lru_cache
+
+from core import rng
+from core.field import FieldElement, PRIME
 
 
 class Polynomial:
@@ -22,12 +25,32 @@ class Polynomial:
             result = result * x + coeff
         return result
 
+    def evaluate_many(self, xs: list[FieldElement]) -> list[FieldElement]:
+        """Evaluate at several points (e.g. every party id when dealing shares).
+
+        Horner's method on the raw ints, wrapping only the final values.
+        """
+        coeffs = [c.value for c in reversed(self.coeffs)]
+        results = []
+        for x in xs:
+            xv = x.value
+            acc = 0
+            for c in coeffs:
+                acc = (acc * xv + c) % PRIME
+            results.append(FieldElement(acc))
+        return results
+
     @staticmethod
-    def random(degree: int, constant: FieldElement) -> 'Polynomial':
-        """Random polynomial of given degree with p(0) = constant."""
+    def random(degree: int, constant: FieldElement,
+               gen: rng.DeterministicRNG | None = None) -> 'Polynomial':
+        """Random polynomial of given degree with p(0) = constant.
+
+        Coefficients come from gen (a DeterministicRNG) if given, else from
+        the global rng.
+        """
         coeffs = [constant]
         for _ in range(degree):
-            coeffs.append(FieldElement.random())
+            coeffs.append(FieldElement.random(gen))
         return Polynomial(coeffs)
 
     @staticmethod
@@ -36,30 +59,24 @@ class Polynomial:
 
         points: list of (x_i, y_i) pairs.
         Returns p(0) = sum_i y_i * lambda_i where lambda_i = prod_{j!=i} (-x_j)/(x_i - x_j).
+        The lambdas depend only on the x-coordinates, so they are cached per x-set.
+        The weighted sum is accumulated on raw ints and reduced once.
         """
-        n = len(points)
-        result = FieldElement.zero()
-        for i in range(n):
-            xi, yi = points[i]
-            numerator = FieldElement.one()
-            denominator = FieldElement.one()
-            for j in range(n):
-                if i == j:
-                    continue
-                xj = points[j][0]
-                numerator = numerator * (-xj)
-                denominator = denominator * (xi - xj)
-            lambda_i = numerator / denominator
-            result = result + yi * lambda_i
-        return result
+        lambdas = _weights_at_zero(tuple(x.value for x, _ in points))
+        acc = 0
+        for (_, yi), lambda_i in zip(points, lambdas):
+            acc += yi.value * lambda_i.value
+        return FieldElement(acc)
 
 
-def lagrange_coefficients_at_zero(x_values: list[FieldElement]) -> list[FieldElement]:
-    """Precompute Lagrange basis coefficients at x=0 for given x-coordinates.
+@lru_cache(maxsize=None)
+def _weights_at_zero(xs: tuple[int, ...]) -> tuple[FieldElement, ...]:
+    """Lagrange basis coefficients at x=0 for integer x-coordinates (memoized).
 
-    Returns lambda_i = prod_{j!=i} (-x_j) / (x_i - x_j) for each i.
+    Party ids come from a small fixed set, so only a handful of distinct
+    x-sets are ever seen and each is computed once.
     """
-    n = len(x_values)
+    n = len(xs)
     lambdas = []
     for i in range(n):
         numerator = FieldElement.one()
@@ -67,7 +84,15 @@ def lagrange_coefficients_at_zero(x_values: list[FieldElement]) -> list[FieldEle
         for j in range(n):
             if i == j:
                 continue
-            numerator = numerator * (-x_values[j])
-            denominator = denominator * (x_values[i] - x_values[j])
+            numerator = numerator * (-xs[j])
+            denominator = denominator * (xs[i] - xs[j])
         lambdas.append(numerator / denominator)
-    return lambdas
+    return tuple(lambdas)
+
+
+def lagrange_coefficients_at_zero(x_values: list[FieldElement]) -> list[FieldElement]:
+    """Precompute Lagrange basis coefficients at x=0 for given x-coordinates.
+
+    Returns lambda_i = prod_{j!=i} (-x_j) / (x_i - x_j) for each i.
+    """
+    return list(_weights_at_zero(tuple(x.value for x in x_values)))
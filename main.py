@@ -22,11 +22,12 @@ NUM_MASK_SHARINGS = 4  # one mask per party output
 
 def preprocess_mask_sharings(n: int, f: int, count: int) -> list[dict[int, FieldElement]]:
     """Generate random mask sharings for output privacy."""
+    points = [FieldElement(i) for i in range(1, n + 1)]
     result = []
     for _ in range(count):
         mask = FieldElement.random()
         poly = Polynomial.random(degree=f, constant=mask)
-        shares = {i: poly.evaluate(FieldElement(i)) for i in range(1, n + 1)}
+        shares = dict(zip(range(1, n + 1), poly.evaluate_many(points)))
         result.append(shares)
     return result
 
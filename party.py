@@ -122,6 +122,7 @@ class Party:
         # Phase 5: Collect bid shares
         bid_shares = {}
         for pid in active_set:
+            await self.css.wait_accepted(f"input_{pid}")
             bid_shares[pid] = self.css.get_share(f"input_{pid}")
 
         # Phase 6: Run auction
@@ -139,17 +140,11 @@ class Party:
             self._enough_accepted.set()
 
     async def _message_dispatcher(self):
-        readers = [self._channel_reader(s)
-                   for s in range(1, self.n + 1) if s != self.party_id]
-        await asyncio.gather(*readers)
-
-    async def _channel_reader(self, sender_id: int):
-        channel = self.network.channels[(sender_id, self.party_id)]
         while True:
             try:
-                msg = await channel.receive()
-                handler = self._handlers.get(msg.msg_type)
-                if handler:
-                    asyncio.create_task(handler(msg))
+                for msg in await self.network.receive_batch(self.party_id):
+                    handler = self._handlers.get(msg.msg_type)
+                    if handler:
+                        asyncio.create_task(handler(msg))
             except asyncio.CancelledError:
                 break
@@ -25,12 +25,20 @@ class ACSProtocol:
         self.ba = ba
 
     async def run(self, accepted_dealers: set[int],
-                  instance_id: str = "main") -> set[int]:
+                  instance_id: str = "main",
+                  candidates: set[int] | None = None) -> set[int]:
         """Run ACS. Returns agreed-upon set of dealer IDs (size >= n-f).
 
         instance_id namespaces all RBC/BA to avoid collisions when running
         multiple ACS instances (e.g. per multiplication gate).
+
+        candidates, if given, must be the same at every party (e.g. the
+        active set); BA for anyone outside it gets input 0, so the result
+        never names a party that did not deal.
         """
+        if candidates is None:
+            candidates = set(range(1, self.n + 1))
+
         # Step 1: RBC-broadcast own proposal
         tag = f"acs:{instance_id}:propose:{self.party_id}"
         await self.rbc.broadcast(tag, list(accepted_dealers))
@@ -71,11 +79,15 @@ class ACSProtocol:
                     asyncio.create_task(run_ba_for(pid, 1))
 
         for pid in range(1, self.n + 1):
-            if pid != self.party_id:
+            if pid not in candidates:
+                ba_started.add(pid)
+                asyncio.create_task(run_ba_for(pid, 0))
+            elif pid != self.party_id:
                 asyncio.create_task(watch_rbc(pid))
 
-        # Start BA for own proposal with input 1
-        if self.party_id in accepted_dealers:
+        # Start BA for own proposal with input 1. Our proposal was RBC'd
+        # above whether or not we count ourselves among accepted_dealers.
+        if self.party_id not in ba_started:
             ba_started.add(self.party_id)
             asyncio.create_task(run_ba_for(self.party_id, 1))
 
@@ -103,10 +103,14 @@ class BAProtocol:
         return inst.decided_value
 
     async def _broadcast_decide(self, ba_key: str, value: int):
+        # Unlike other broadcasts, wait until every peer holds the decision.
+        # ACS inputs 0 to its remaining BAs once n-f of them have decided 1,
+        # so returning while DECIDE deliveries are still pending would get
+        # a slow honest party's proposal excluded.
         await self.network.broadcast(self.party_id, Message(
             "BA_DECIDE", self.party_id, {
                 "ba_key": ba_key, "value": value,
-            }, f"ba:{ba_key}:decide"))
+            }, f"ba:{ba_key}:decide"), wait=True)
 
     async def handle_vote(self, msg: Message):
         ba_key = msg.payload["ba_key"]
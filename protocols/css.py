@@ -9,7 +9,7 @@ READY messages are still broadcast as an optimization.
 import asyncio
 import hashlib
 from enum import Enum
-from core.field import FieldElement
+from core.field import FieldElement, party_points
 from core.polynomial import Polynomial
 from sim.network import Network, Message
 
@@ -28,6 +28,7 @@ class CSSProtocol:
         self.n = n
         self.f = f
         self.network = network
+        self._pid_as_field = party_points(n)
 
         self._shares: dict[str, FieldElement] = {}
         self._status: dict[str, CSSStatus] = {}
@@ -36,6 +37,7 @@ class CSSProtocol:
         self._ready_sent: set[str] = set()
         self._finalized: dict[str, asyncio.Event] = {}
         self._recover_shares: dict[str, dict[int, FieldElement]] = {}
+        self._recover_ready: dict[str, asyncio.Event] = {}
 
     def _ensure_session(self, session_id: str):
         if session_id not in self._status:
@@ -47,22 +49,38 @@ class CSSProtocol:
         if session_id not in self._recover_shares:
             self._recover_shares[session_id] = {}
 
+    def _recover_event(self, key: str) -> asyncio.Event:
+        """Event set once f+1 recover shares are held under key."""
+        ev = self._recover_ready.get(key)
+        if ev is None:
+            ev = self._recover_ready[key] = asyncio.Event()
+        return ev
+
+    def _add_recover_share(self, key: str, point: int, share: FieldElement):
+        shares = self._recover_shares.setdefault(key, {})
+        shares[point] = share
+        if len(shares) >= self.f + 1:
+            self._recover_event(key).set()
+
     async def share(self, secret: FieldElement, session_id: str):
         """Dealer shares a secret via degree-f polynomial."""
         self._ensure_session(session_id)
         poly = Polynomial.random(degree=self.f, constant=secret)
-        for i in range(1, self.n + 1):
-            share_val = poly.evaluate(FieldElement(i))
+        share_vals = poly.evaluate_many(self._pid_as_field[1:])
+        sends = []
+        for i, share_val in enumerate(share_vals, start=1):
             if i == self.party_id:
                 self._shares[session_id] = share_val
-                await self._send_echo(session_id, share_val)
+                sends.append(self._send_echo(session_id, share_val))
             else:
-                await self.network.send(
+                sends.append(self.network.send(
                     self.party_id, i,
                     Message("CSS_SHARE", self.party_id, {
                         "session_id": session_id,
                         "share_value": share_val.value,
-                    }, session_id))
+                    }, session_id)))
+        # Fan out concurrently rather than paying each link's delay in turn
+        await asyncio.gather(*sends)
 
     async def _send_echo(self, session_id: str, share_val: FieldElement):
         msg = Message("CSS_ECHO", self.party_id, {
@@ -114,9 +132,9 @@ class CSSProtocol:
     def _derive_share(self, session_id: str):
         """Compute our share via Lagrange from f+1 echoes."""
         echoes = self._echoes[session_id]
-        pts = [(FieldElement(pt), sv)
+        pts = [(self._pid_as_field[pt], sv)
                for pt, sv in list(echoes.items())[:self.f + 1]]
-        x_eval = FieldElement(self.party_id)
+        x_eval = self._pid_as_field[self.party_id]
         result = FieldElement.zero()
         for i in range(len(pts)):
             num = den = FieldElement.one()
@@ -155,10 +173,9 @@ class CSSProtocol:
             "CSS_RECOVER", self.party_id, {
                 "session_id": session_id, "point": self.party_id,
                 "share_value": my_share.value}, session_id))
-        self._recover_shares[session_id][self.party_id] = my_share
-        while len(self._recover_shares[session_id]) < self.f + 1:
-            await asyncio.sleep(0.001)
-        pts = [(FieldElement(p), s)
+        self._add_recover_share(session_id, self.party_id, my_share)
+        await self._recover_event(session_id).wait()
+        pts = [(self._pid_as_field[p], s)
                for p, s in self._recover_shares[session_id].items()]
         return Polynomial.interpolate_at_zero(pts[:self.f + 1])
 
@@ -166,19 +183,16 @@ class CSSProtocol:
         self._ensure_session(session_id)
         my_share = self.get_share(session_id)
         rk = f"reveal_{session_id}"
-        if rk not in self._recover_shares:
-            self._recover_shares[rk] = {}
         if self.party_id == target:
-            self._recover_shares[rk][self.party_id] = my_share
+            self._add_recover_share(rk, self.party_id, my_share)
         else:
             await self.network.send(self.party_id, target, Message(
                 "CSS_REVEAL", self.party_id, {
                     "session_id": session_id, "point": self.party_id,
                     "share_value": my_share.value}, session_id))
         if self.party_id == target:
-            while len(self._recover_shares[rk]) < self.f + 1:
-                await asyncio.sleep(0.001)
-            pts = [(FieldElement(p), s)
+            await self._recover_event(rk).wait()
+            pts = [(self._pid_as_field[p], s)
                    for p, s in self._recover_shares[rk].items()]
             return Polynomial.interpolate_at_zero(pts[:self.f + 1])
         return None
@@ -186,11 +200,10 @@ class CSSProtocol:
     async def handle_recover(self, msg: Message):
         sid = msg.payload["session_id"]
         self._ensure_session(sid)
-        self._recover_shares[sid][msg.payload["point"]] = FieldElement(msg.payload["share_value"])
+        self._add_recover_share(sid, msg.payload["point"],
+                                FieldElement(msg.payload["share_value"]))
 
     async def handle_reveal(self, msg: Message):
         sid = msg.payload["session_id"]
-        rk = f"reveal_{sid}"
-        if rk not in self._recover_shares:
-            self._recover_shares[rk] = {}
-        self._recover_shares[rk][msg.payload["point"]] = FieldElement(msg.payload["share_value"])
+        self._add_recover_share(f"reveal_{sid}", msg.payload["point"],
+                                FieldElement(msg.payload["share_value"]))
@@ -6,15 +6,25 @@ Multiplication uses CSS for resharing + per-gate ACS to agree on T:
 3. Per-gate ACS selects common T of size >= n-f = 2f+1
 4. Lagrange recombination over T reduces degree back to f
 
+multiply_batch() runs a layer of independent gates under a single ACS.
+
 No timeouts. Terminates with probability 1 via beacon-driven BA in ACS.
 """
 
 import asyncio
-from core.field import FieldElement
+from dataclasses import dataclass, field
+from core.field import FieldElement, party_points
 from core.polynomial import Polynomial, lagrange_coefficients_at_zero
 from sim.network import Network, Message
 
 
+@dataclass(slots=True)
+class OpenSession:
+    """Shares collected for one open_value session."""
+    shares: dict[int, FieldElement] = field(default_factory=dict)
+    event: asyncio.Event = field(default_factory=asyncio.Event)
+
+
 class MPCArithmetic:
     """Arithmetic operations on secret-shared values."""
 
@@ -33,15 +43,25 @@ class MPCArithmetic:
         self.rbc = rbc
         self.acs_factory = acs_factory
 
+        # Party ids as field elements (evaluation points), indexed by pid
+        self._pid_as_field = party_points(n)
+
         self._active_set: list[int] | None = None
+        self._active_set_frozen: frozenset[int] = frozenset()
 
         # For open_value only (simple broadcast + reconstruct)
-        self._open_shares: dict[str, dict[int, FieldElement]] = {}
-        self._open_events: dict[str, asyncio.Event] = {}
+        self._open_sessions: dict[str, OpenSession] = {}
+
+    def _get_open_session(self, session_id: str) -> OpenSession:
+        sess = self._open_sessions.get(session_id)
+        if sess is None:
+            sess = self._open_sessions[session_id] = OpenSession()
+        return sess
 
     def set_active_set(self, active_set: set[int]):
         """Set the active set T determined by the initial ACS."""
         self._active_set = sorted(active_set)
+        self._active_set_frozen = frozenset(active_set)
 
     def add(self, share_a: FieldElement, share_b: FieldElement) -> FieldElement:
         return share_a + share_b
@@ -68,36 +88,30 @@ class MPCArithmetic:
 
         # Step 2: CSS-share d_i (each active party acts as dealer)
         css_sid = f"mul:{session_id}:d:{self.party_id}"
-        if self.party_id in self._active_set:
+        if self.party_id in self._active_set_frozen:
             await self.css.share(d_i, css_sid)
 
         # Wait for CSS acceptance of each active party's resharing
         accepted_dealers = set()
+        # Set once n-f CSS sharings are accepted (enough for T)
+        enough_event = asyncio.Event()
 
         async def wait_css(pid):
             sid = f"mul:{session_id}:d:{pid}"
             await self.css.wait_accepted(sid)
             accepted_dealers.add(pid)
+            if len(accepted_dealers) >= self.n - self.f:
+                enough_event.set()
 
         # Watch all active parties' CSS sharings
         css_tasks = [asyncio.create_task(wait_css(pid))
                      for pid in self._active_set]
-
-        # Wait until n-f CSS sharings are accepted (enough for T)
-        enough_event = asyncio.Event()
-
-        async def monitor_accepted():
-            while len(accepted_dealers) < self.n - self.f:
-                await asyncio.sleep(0.001)
-            enough_event.set()
-
-        monitor = asyncio.create_task(monitor_accepted())
         await enough_event.wait()
-        monitor.cancel()
 
         # Step 3: Per-gate ACS to agree on T
         acs = self.acs_factory()
-        gate_t = await acs.run(accepted_dealers, instance_id=f"mul:{session_id}")
+        gate_t = await acs.run(accepted_dealers, instance_id=f"mul:{session_id}",
+                               candidates=self._active_set_frozen)
 
         # Deterministic truncation to exactly n-f = 2f+1 parties
         gate_t_list = sorted(gate_t)[:self.n - self.f]
@@ -107,26 +121,83 @@ class MPCArithmetic:
             t.cancel()
 
         # Step 4: Lagrange recombination
-        x_values = [FieldElement(pid) for pid in gate_t_list]
+        x_values = [self._pid_as_field[pid] for pid in gate_t_list]
         lambdas = lagrange_coefficients_at_zero(x_values)
 
         result = FieldElement.zero()
         for idx, pid in enumerate(gate_t_list):
             css_share_sid = f"mul:{session_id}:d:{pid}"
+            # T is agreed, but our copy of pid's sharing may still be in flight
+            await self.css.wait_accepted(css_share_sid)
             d_pid_share = self.css.get_share(css_share_sid)
             result = result + lambdas[idx] * d_pid_share
 
         return result
 
+    async def multiply_batch(self, pairs: list[tuple[FieldElement, FieldElement]],
+                             session_id: str) -> list[FieldElement]:
+        """Multiply independent pairs of secret-shared values with one ACS.
+
+        Same steps as multiply(), but all local products are CSS-shared up
+        front and a dealer is accepted only once all of its sharings are.
+        A single ACS then fixes T for the whole batch, so every gate is
+        recombined with the same Lagrange coefficients.
+        """
+        assert self._active_set is not None
+        if not pairs:
+            return []
+
+        def gate_sid(gate: int, pid: int) -> str:
+            return f"mulb:{session_id}:{gate}:d:{pid}"
+
+        # Step 1+2: Local products, CSS-shared concurrently
+        if self.party_id in self._active_set_frozen:
+            await asyncio.gather(*[
+                self.css.share(a * b, gate_sid(g, self.party_id))
+                for g, (a, b) in enumerate(pairs)])
+
+        # Wait until n-f dealers have all of their sharings accepted
+        accepted_dealers = set()
+        enough_event = asyncio.Event()
+
+        async def wait_dealer(pid):
+            for g in range(len(pairs)):
+                await self.css.wait_accepted(gate_sid(g, pid))
+            accepted_dealers.add(pid)
+            if len(accepted_dealers) >= self.n - self.f:
+                enough_event.set()
+
+        dealer_tasks = [asyncio.create_task(wait_dealer(pid))
+                        for pid in self._active_set]
+        await enough_event.wait()
+
+        # Step 3: One ACS for the whole batch
+        acs = self.acs_factory()
+        batch_t = await acs.run(accepted_dealers, instance_id=f"mulb:{session_id}",
+                                candidates=self._active_set_frozen)
+        batch_t_list = sorted(batch_t)[:self.n - self.f]
+
+        for t in dealer_tasks:
+            t.cancel()
+
+        # Step 4: Shared Lagrange coefficients, one dot product per gate
+        x_values = [self._pid_as_field[pid] for pid in batch_t_list]
+        lambdas = lagrange_coefficients_at_zero(x_values)
+
+        results = []
+        for g in range(len(pairs)):
+            result = FieldElement.zero()
+            for idx, pid in enumerate(batch_t_list):
+                await self.css.wait_accepted(gate_sid(g, pid))
+                result = result + lambdas[idx] * self.css.get_share(gate_sid(g, pid))
+            results.append(result)
+        return results
+
     # --- open_value: simple broadcast + reconstruct (no CSS needed) ---
 
     async def open_value(self, share: FieldElement, session_id: str) -> FieldElement:
         """Public reconstruction: broadcast shares, reconstruct from f+1."""
-        open_key = f"open_{session_id}"
-        if open_key not in self._open_shares:
-            self._open_shares[open_key] = {}
-        if open_key not in self._open_events:
-            self._open_events[open_key] = asyncio.Event()
+        sess = self._get_open_session(session_id)
 
         await self.network.broadcast(self.party_id, Message(
             "MPC_OPEN", self.party_id, {
@@ -134,23 +205,18 @@ class MPCArithmetic:
                 "share_value": share.value,
             }, session_id))
 
-        self._open_shares[open_key][self.party_id] = share
-        if len(self._open_shares[open_key]) >= self.f + 1:
-            self._open_events[open_key].set()
+        sess.shares[self.party_id] = share
+        if len(sess.shares) >= self.f + 1:
+            sess.event.set()
 
-        await self._open_events[open_key].wait()
+        await sess.event.wait()
 
-        points = [(FieldElement(pid), s)
-                  for pid, s in self._open_shares[open_key].items()]
+        points = [(self._pid_as_field[pid], s)
+                  for pid, s in sess.shares.items()]
         return Polynomial.interpolate_at_zero(points[:self.f + 1])
 
     async def handle_open(self, msg: Message):
-        sid = msg.payload["session_id"]
-        open_key = f"open_{sid}"
-        if open_key not in self._open_shares:
-            self._open_shares[open_key] = {}
-        if open_key not in self._open_events:
-            self._open_events[open_key] = asyncio.Event()
-        self._open_shares[open_key][msg.sender] = FieldElement(msg.payload["share_value"])
-        if len(self._open_shares[open_key]) >= self.f + 1:
-            self._open_events[open_key].set()
+        sess = self._get_open_session(msg.payload["session_id"])
+        sess.shares[msg.sender] = FieldElement(msg.payload["share_value"])
+        if len(sess.shares) >= self.f + 1:
+            sess.event.set()
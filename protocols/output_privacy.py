@@ -8,7 +8,7 @@ For each party's output [o_i]:
 """
 
 import asyncio
-from core.field import FieldElement
+from core.field import FieldElement, party_points
 from core.polynomial import Polynomial
 from sim.network import Network, Message
 from protocols.mpc_arithmetic import MPCArithmetic
@@ -24,8 +24,10 @@ class OutputPrivacy:
         self.f = f
         self.network = network
         self.mpc = mpc
+        self._pid_as_field = party_points(n)
 
         self._mask_shares: dict[str, dict[int, FieldElement]] = {}
+        self._mask_ready: dict[str, asyncio.Event] = {}
 
     async def reveal_to_owner(self, output_share: FieldElement,
                                owner_party_id: int,
@@ -43,12 +45,10 @@ class OutputPrivacy:
 
         # Step 3: Send mask share privately to owner
         mask_key = f"mask_{session_id}"
-        if mask_key not in self._mask_shares:
-            self._mask_shares[mask_key] = {}
 
         if self.party_id == owner_party_id:
             # Record own mask share
-            self._mask_shares[mask_key][self.party_id] = mask_share
+            self._add_mask_share(mask_key, self.party_id, mask_share)
         else:
             # Send mask share to owner
             msg = Message("MASK_SHARE", self.party_id, {
@@ -60,11 +60,10 @@ class OutputPrivacy:
 
         # Step 4: Owner reconstructs mask and computes output
         if self.party_id == owner_party_id:
-            while len(self._mask_shares[mask_key]) < self.f + 1:
-                await asyncio.sleep(0.001)
+            await self._mask_event(mask_key).wait()
 
             points = [
-                (FieldElement(pid), share)
+                (self._pid_as_field[pid], share)
                 for pid, share in self._mask_shares[mask_key].items()
             ]
             mask = Polynomial.interpolate_at_zero(points[:self.f + 1])
@@ -76,9 +75,19 @@ class OutputPrivacy:
     async def handle_mask_share(self, msg: Message):
         """Handle incoming MASK_SHARE message."""
         sid = msg.payload["session_id"]
-        mask_key = f"mask_{sid}"
-        if mask_key not in self._mask_shares:
-            self._mask_shares[mask_key] = {}
         point = msg.payload["point"]
         share_val = FieldElement(msg.payload["share_value"])
-        self._mask_shares[mask_key][point] = share_val
+        self._add_mask_share(f"mask_{sid}", point, share_val)
+
+    def _mask_event(self, mask_key: str) -> asyncio.Event:
+        """Event set once f+1 mask shares are held under mask_key."""
+        ev = self._mask_ready.get(mask_key)
+        if ev is None:
+            ev = self._mask_ready[mask_key] = asyncio.Event()
+        return ev
+
+    def _add_mask_share(self, mask_key: str, point: int, share: FieldElement):
+        shares = self._mask_shares.setdefault(mask_key, {})
+        shares[point] = share
+        if len(shares) >= self.f + 1:
+            self._mask_event(mask_key).set()
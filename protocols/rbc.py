@@ -25,7 +25,7 @@ class RBCInstance:
         self.sent_ready = False
         self.delivered = False
         self.delivered_value = None
-        self.delivered_event = asyncio.Event()
+        self.delivered_event: asyncio.Event | None = None  # created on first wait
         self._payload_cache: dict[str, object] = {}  # payload_key -> payload
 
     def _payload_key(self, payload) -> str:
@@ -134,16 +134,22 @@ class RBCProtocol:
                 "payload": payload,
             }, tag)
             await self.network.broadcast(self.party_id, ready_msg)
+            inst.ready_counts[pk].add(self.party_id)
 
         # Deliver: if n-f READYs → deliver
         if len(inst.ready_counts[pk]) >= self.n - self.f and not inst.delivered:
             inst.delivered = True
             inst.delivered_value = payload
-            inst.delivered_event.set()
+            if inst.delivered_event is not None:
+                inst.delivered_event.set()
 
     async def wait_deliver(self, sender: int, tag: str, timeout: float = None):
         """Wait until the RBC instance for (sender, tag) delivers."""
         inst = self._get_instance(sender, tag)
+        if inst.delivered:
+            return inst.delivered_value
+        if inst.delivered_event is None:
+            inst.delivered_event = asyncio.Event()
         if timeout:
             await asyncio.wait_for(inst.delivered_event.wait(), timeout=timeout)
         else:
@@ -1,9 +1,11 @@
 """Async communication layer for MPC parties with configurable delays and omission policies."""
 
 import asyncio
+import bisect
 import time
-from dataclasses import dataclass
-from collections import defaultdict
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
 
 from core import rng
 
@@ -12,7 +14,7 @@ from core import rng
 
 class DelayModel:
     """Base class for message delay models."""
-    def sample(self) -> float:
+    def sample(self, sender: int = 0, receiver: int = 0) -> float:
         return 0.0
 
 
@@ -21,7 +23,7 @@ class UniformDelay(DelayModel):
         self.min_d = min_d
         self.max_d = max_d
 
-    def sample(self) -> float:
+    def sample(self, sender: int = 0, receiver: int = 0) -> float:
         return rng.uniform(self.min_d, self.max_d)
 
 
@@ -29,7 +31,7 @@ class ExponentialDelay(DelayModel):
     def __init__(self, mean: float = 0.01):
         self.lambd = 1.0 / mean if mean > 0 else 100.0
 
-    def sample(self) -> float:
+    def sample(self, sender: int = 0, receiver: int = 0) -> float:
         return rng.expovariate(self.lambd)
 
 
@@ -37,7 +39,7 @@ class FixedDelay(DelayModel):
     def __init__(self, delay: float = 0.0):
         self.delay = delay
 
-    def sample(self) -> float:
+    def sample(self, sender: int = 0, receiver: int = 0) -> float:
         return self.delay
 
 
@@ -49,15 +51,9 @@ class AdversarialDelay(DelayModel):
         self.slow_pairs = slow_pairs or set()
         self.slow_range = slow_range
         self.fast_range = fast_range
-        self._current_sender = None
-        self._current_receiver = None
 
-    def set_context(self, sender: int, receiver: int):
-        self._current_sender = sender
-        self._current_receiver = receiver
-
-    def sample(self) -> float:
-        if (self._current_sender, self._current_receiver) in self.slow_pairs:
+    def sample(self, sender: int = 0, receiver: int = 0) -> float:
+        if (sender, receiver) in self.slow_pairs:
             return rng.uniform(*self.slow_range)
         return rng.uniform(*self.fast_range)
 
@@ -65,27 +61,38 @@ class AdversarialDelay(DelayModel):
 # --- Omission Policies ---
 
 class OmissionPolicy:
-    """Base class for omission fault policies."""
+    """Base class for omission fault policies.
+
+    pair_deterministic: verdict depends only on (sender, receiver), so the
+    Network may evaluate it once per link instead of once per message.
+    own_sends_only: never drops a message unless sender == self.party_id.
+    """
+    pair_deterministic = False
+    own_sends_only = False
+
     def should_drop(self, sender: int, receiver: int, msg) -> bool:
         return False
 
 
 class DropAll(OmissionPolicy):
     """Drop all messages to/from a party."""
+    pair_deterministic = True
+
     def __init__(self, party_id: int, direction: str = 'both'):
         self.party_id = party_id
         self.direction = direction
+        self._check_send = direction in ('send', 'both')
+        self._check_recv = direction in ('receive', 'both')
 
     def should_drop(self, sender, receiver, msg) -> bool:
-        if self.direction in ('send', 'both') and sender == self.party_id:
-            return True
-        if self.direction in ('receive', 'both') and receiver == self.party_id:
-            return True
-        return False
+        return ((self._check_send and sender == self.party_id)
+                or (self._check_recv and receiver == self.party_id))
 
 
 class DropProb(OmissionPolicy):
     """Drop messages from a party with probability p."""
+    own_sends_only = True
+
     def __init__(self, party_id: int, p: float = 0.5):
         self.party_id = party_id
         self.p = p
@@ -98,6 +105,8 @@ class DropProb(OmissionPolicy):
 
 class DropTypes(OmissionPolicy):
     """Drop only specific message types from a party."""
+    own_sends_only = True
+
     def __init__(self, party_id: int, msg_types: set[str], p: float = 1.0):
         self.party_id = party_id
         self.msg_types = msg_types
@@ -115,6 +124,9 @@ class SelectiveOmission(OmissionPolicy):
     Models the key adversarial behavior: a corrupt party selectively
     chooses which parties receive its messages.
     """
+    pair_deterministic = True
+    own_sends_only = True
+
     def __init__(self, party_id: int, drop_to: set[int]):
         """
         party_id: the omitting party
@@ -128,37 +140,94 @@ class SelectiveOmission(OmissionPolicy):
 
 
 class CompositeOmission(OmissionPolicy):
-    """Combine multiple omission policies (drop if ANY policy says drop)."""
+    """Combine multiple omission policies (drop if ANY policy says drop).
+
+    Nested composites are flattened, so policies holds only leaf policies.
+    """
     def __init__(self, policies: list[OmissionPolicy]):
-        self.policies = policies
+        self.policies: tuple[OmissionPolicy, ...] = tuple(
+            q for p in policies
+            for q in (p.policies if isinstance(p, CompositeOmission) else (p,)))
 
     def should_drop(self, sender, receiver, msg) -> bool:
-        return any(p.should_drop(sender, receiver, msg) for p in self.policies)
+        for p in self.policies:
+            if p.should_drop(sender, receiver, msg):
+                return True
+        return False
 
 
 class BurstDrop(OmissionPolicy):
     """Drop messages from a party during time intervals."""
+    own_sends_only = True
+
     def __init__(self, party_id: int, bursts: list[tuple[float, float]] = None):
         self.party_id = party_id
         self.bursts = bursts or []
-        self._start_time = time.time()
+        # Overlapping bursts merged and sorted, so one bisect finds the
+        # only interval that can contain a given time
+        merged: list[list[float]] = []
+        for t0, t1 in sorted(self.bursts):
+            if merged and t0 <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], t1)
+            else:
+                merged.append([t0, t1])
+        self._starts = [t0 for t0, _ in merged]
+        self._ends = [t1 for _, t1 in merged]
+        self._start_time = time.monotonic()
 
     def should_drop(self, sender, receiver, msg) -> bool:
         if sender != self.party_id:
             return False
-        elapsed = time.time() - self._start_time
-        return any(t0 <= elapsed <= t1 for t0, t1 in self.bursts)
+        elapsed = time.monotonic() - self._start_time
+        i = bisect.bisect_right(self._starts, elapsed) - 1
+        return i >= 0 and elapsed <= self._ends[i]
 
 
 # --- Messages and Metrics ---
 
-@dataclass
+# msg_type string -> small int id, and back; shared by all networks
+_MSG_TYPE_IDS: dict[str, int] = {}
+_MSG_TYPE_NAMES: list[str] = []
+
+
+def _msg_type_id(msg_type: str) -> int:
+    tid = _MSG_TYPE_IDS.get(msg_type)
+    if tid is None:
+        tid = _MSG_TYPE_IDS[msg_type] = len(_MSG_TYPE_NAMES)
+        _MSG_TYPE_NAMES.append(msg_type)
+    return tid
+
+
+# The protocols' own message types get the low ids up front, so metrics
+# can size their counters once instead of growing them mid-run
+_KNOWN_MSG_TYPES = (
+    "RBC_INIT", "RBC_ECHO", "RBC_READY",
+    "BA_VOTE", "BA_DECIDE",
+    "CSS_SHARE", "CSS_ECHO", "CSS_READY", "CSS_RECOVER", "CSS_REVEAL",
+    "MPC_OPEN", "MASK_SHARE",
+)
+for _t in _KNOWN_MSG_TYPES:
+    _msg_type_id(_t)
+del _t
+
+
+@dataclass(slots=True)
 class Message:
-    """Tagged message with protocol identifier."""
+    """Tagged message with protocol identifier.
+
+    One Message object is shared by every recipient of a broadcast, so its
+    payload is stored as a read-only view.
+    """
     msg_type: str
     sender: int
-    payload: dict
+    payload: Mapping
     session_id: str = ""
+    type_id: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.type_id = _msg_type_id(self.msg_type)
+        if type(self.payload) is not MappingProxyType:
+            self.payload = MappingProxyType(self.payload)
 
 
 class NetworkMetrics:
@@ -167,9 +236,26 @@ class NetworkMetrics:
     def __init__(self):
         self.messages_sent = 0
         self.messages_dropped = 0
-        self.by_type: dict[str, int] = defaultdict(int)
+        self._type_counts = [0] * len(_MSG_TYPE_NAMES)  # indexed by Message.type_id
         self.start_time = None
 
+    def count(self, type_id: int, k: int = 1):
+        """Record k sends of the message type with the given id."""
+        counts = self._type_counts
+        if type_id >= len(counts):
+            counts.extend([0] * (type_id + 1 - len(counts)))
+        counts[type_id] += k
+        self.messages_sent += k
+
+    @property
+    def by_type(self) -> Mapping[str, int]:
+        """Per-message-type send counts (types never sent are omitted).
+
+        A read-only snapshot built from the counters; record sends with count().
+        """
+        return MappingProxyType({_MSG_TYPE_NAMES[tid]: c
+                                 for tid, c in enumerate(self._type_counts) if c})
+
     def start(self):
         self.start_time = time.time()
 
@@ -183,74 +269,193 @@ class NetworkMetrics:
 # --- Channel and Network ---
 
 class MessageChannel:
-    """Unidirectional async channel between two parties."""
+    """Unidirectional link between two parties.
+
+    Delivers into the receiver's inbox, which is shared by all of its
+    incoming links, so a receiver waits on one queue instead of n-1.
+    """
 
-    def __init__(self, sender_id: int, receiver_id: int):
+    def __init__(self, sender_id: int, receiver_id: int, inbox: asyncio.Queue):
         self.sender_id = sender_id
         self.receiver_id = receiver_id
-        self.queue: asyncio.Queue = asyncio.Queue()
+        self.inbox = inbox
 
     async def send(self, message: Message, delay: float):
         if delay > 0:
             await asyncio.sleep(delay)
-        await self.queue.put(message)
+        await self.inbox.put(message)
 
-    async def receive(self):
-        return await self.queue.get()
 
-    def try_receive(self):
-        try:
-            return self.queue.get_nowait()
-        except asyncio.QueueEmpty:
-            return None
+async def _deliver_after(delay: float, inboxes: list[asyncio.Queue], msg: Message):
+    """Enqueue msg into several inboxes after one shared delay."""
+    await asyncio.sleep(delay)
+    for inbox in inboxes:
+        inbox.put_nowait(msg)
 
 
 class Network:
-    """Manages all channels between n parties."""
+    """Manages all channels between n parties.
+
+    The inboxes are asyncio queues, which bind to the event loop that first
+    waits on them, so a Network serves a single asyncio.run() and is not
+    reusable across runs.
+    """
 
     def __init__(self, n: int, delay_model: DelayModel | None = None,
                  omission_policy: OmissionPolicy | None = None):
         self.n = n
         self.delay_model = delay_model or UniformDelay(0.0, 0.01)
-        self.omission_policy = omission_policy
+        self._delay_is_zero = (isinstance(self.delay_model, FixedDelay)
+                               and self.delay_model.delay == 0)
+        self.inboxes: dict[int, asyncio.Queue] = {
+            j: asyncio.Queue() for j in range(1, n + 1)}
         self.channels: dict[tuple[int, int], MessageChannel] = {}
+        # Same channels as _links[sender][receiver], for the per-message path
+        self._links: list[list[MessageChannel | None]] = [
+            [None] * (n + 1) for _ in range(n + 1)]
         self.metrics = NetworkMetrics()
+        self.omission_policy = omission_policy
+        # In-flight deliveries; holding a reference keeps them from being GC'd
+        self._pending: set[asyncio.Task] = set()
 
         for i in range(1, n + 1):
             for j in range(1, n + 1):
                 if i != j:
-                    self.channels[(i, j)] = MessageChannel(i, j)
+                    self.channels[(i, j)] = self._links[i][j] = MessageChannel(
+                        i, j, self.inboxes[j])
 
     async def send(self, sender: int, receiver: int, msg: Message):
-        self.metrics.messages_sent += 1
-        self.metrics.by_type[msg.msg_type] += 1
+        """Hand msg to the network. Returns without waiting for the link delay;
+        delivery into the receiver's inbox happens in a background task."""
+        self.metrics.count(msg.type_id)
+        self._post(sender, receiver, msg)
+
+    async def broadcast(self, sender: int, msg: Message, wait: bool = False):
+        """Send msg to every other party, counting the whole fan-out at once.
+
+        Every recipient gets the same Message, so the sender's drop row,
+        policies and links are looked up once for the whole fan-out, and
+        recipients that drew the same delay share one timer.
 
-        # Check omission policy
-        if self.omission_policy and self.omission_policy.should_drop(sender, receiver, msg):
+        With wait, return only once every copy has been delivered, for the
+        few steps whose timing depends on peers already holding msg.
+        """
+        self.metrics.count(msg.type_id, self.n - 1)
+        drop_row = self._drop[sender]
+        policies = self._per_message[sender]
+        links = self._links[sender]
+        zero = self._delay_is_zero
+        lossless = self._lossless
+        dropped = 0
+        later: dict[float, list[asyncio.Queue]] = {}
+        for j in range(1, self.n + 1):
+            if j == sender:
+                continue
+            if not lossless and (drop_row[j] or (policies and self._policy_drops(
+                    policies, sender, j, msg))):
+                dropped += 1
+                continue
+            delay = 0.0 if zero else self.delay_model.sample(sender, j)
+            if delay <= 0:
+                links[j].inbox.put_nowait(msg)
+            else:
+                later.setdefault(delay, []).append(links[j].inbox)
+        self.metrics.messages_dropped += dropped
+        deliveries = [self._spawn(_deliver_after(delay, inboxes, msg))
+                      for delay, inboxes in later.items()]
+        if wait and deliveries:
+            await asyncio.wait(deliveries)
+
+    def _post_lossless(self, sender: int, receiver: int, msg: Message):
+        """_post when no omission policy is set: delay and deliver."""
+        delay = 0.0 if self._delay_is_zero else self.delay_model.sample(sender, receiver)
+        self._deliver(self._links[sender][receiver], msg, delay)
+
+    def _post_checked(self, sender: int, receiver: int, msg: Message):
+        """Apply omission and delay for one link, then schedule delivery."""
+        # Check omission policy: precompiled link verdict, then any
+        # per-message policies that apply to this sender
+        if self._drop[sender][receiver] or self._policy_drops(
+                self._per_message[sender], sender, receiver, msg):
             self.metrics.messages_dropped += 1
             return
 
         # Compute delay
-        if isinstance(self.delay_model, AdversarialDelay):
-            self.delay_model.set_context(sender, receiver)
-        delay = self.delay_model.sample()
+        delay = 0.0 if self._delay_is_zero else self.delay_model.sample(sender, receiver)
+        self._deliver(self._links[sender][receiver], msg, delay)
+
+    @staticmethod
+    def _policy_drops(policies: list[OmissionPolicy], sender: int,
+                      receiver: int, msg: Message) -> bool:
+        for policy in policies:
+            if policy.should_drop(sender, receiver, msg):
+                return True
+        return False
 
-        await self.channels[(sender, receiver)].send(msg, delay)
+    def _deliver(self, channel: MessageChannel, msg: Message, delay: float):
+        if delay <= 0:
+            # Nothing to wait for: enqueue in this tick, no task needed
+            channel.inbox.put_nowait(msg)
+            return
+        self._spawn(channel.send(msg, delay))
 
-    async def broadcast(self, sender: int, msg: Message):
-        tasks = []
-        for j in range(1, self.n + 1):
-            if j != sender:
-                tasks.append(self.send(sender, j, msg))
-        await asyncio.gather(*tasks)
+    def _spawn(self, coro) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+        return task
+
+    @property
+    def omission_policy(self) -> OmissionPolicy | None:
+        return self._omission_policy
+
+    @omission_policy.setter
+    def omission_policy(self, policy: OmissionPolicy | None):
+        """Install a policy; the drop table is recompiled right away."""
+        self._omission_policy = policy
+        self._compile_omission()
 
     def set_omission(self, party_id: int, direction: str = 'both'):
         """Convenience: set a DropAll omission policy for a party."""
         self.omission_policy = DropAll(party_id, direction)
 
-    def get_incoming_channels(self, party_id: int) -> list[MessageChannel]:
-        return [
-            self.channels[(s, party_id)]
-            for s in range(1, self.n + 1)
-            if s != party_id
-        ]
+    def _compile_omission(self):
+        """Split the omission policy into a link table and a per-message part.
+
+        Pair-deterministic policies are evaluated once for every link into
+        _drop[sender][receiver]. The rest (probabilistic, type- or
+        time-dependent) are kept in _per_message[sender], listing only
+        the policies that can drop that sender's messages. Without any
+        policy, _post is bound to the variant that skips both.
+        """
+        n = self.n
+        self._drop = [[False] * (n + 1) for _ in range(n + 1)]
+        self._per_message: list[list[OmissionPolicy]] = [[] for _ in range(n + 1)]
+
+        policy = self.omission_policy
+        self._lossless = policy is None
+        self._post = self._post_lossless if self._lossless else self._post_checked
+        if policy is None:
+            return
+        leaves = (policy.policies if isinstance(policy, CompositeOmission)
+                  else (policy,))
+        for policy in leaves:
+            if policy.pair_deterministic:
+                for i in range(1, n + 1):
+                    for j in range(1, n + 1):
+                        if i != j and policy.should_drop(i, j, None):
+                            self._drop[i][j] = True
+            elif policy.own_sends_only:
+                self._per_message[policy.party_id].append(policy)
+            else:
+                for i in range(1, n + 1):
+                    self._per_message[i].append(policy)
+
+    async def receive_batch(self, party_id: int, limit: int = 64) -> list[Message]:
+        """Wait for the next message to party_id, then also take whatever is
+        already queued behind it (up to limit) without yielding again."""
+        inbox = self.inboxes[party_id]
+        msgs = [await inbox.get()]
+        while len(msgs) < limit and not inbox.empty():
+            msgs.append(inbox.get_nowait())
+        return msgs
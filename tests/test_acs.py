@@ -21,34 +21,30 @@ async def run_acs_test(accepted_per_party, omitting=None, seed=30):
             for i in range(1, n + 1)]
 
     async def dispatch(idx):
+        handlers = {
+            "RBC_INIT": rbcs[idx].handle_init,
+            "RBC_ECHO": rbcs[idx].handle_echo,
+            "RBC_READY": rbcs[idx].handle_ready,
+            "BA_VOTE": bas[idx].handle_vote,
+            "BA_DECIDE": bas[idx].handle_decide,
+        }
         while True:
-            for s in range(1, n + 1):
-                if s == idx + 1:
-                    continue
-                msg = net.channels[(s, idx + 1)].try_receive()
-                if msg:
-                    handlers = {
-                        "RBC_INIT": rbcs[idx].handle_init,
-                        "RBC_ECHO": rbcs[idx].handle_echo,
-                        "RBC_READY": rbcs[idx].handle_ready,
-                        "BA_VOTE": bas[idx].handle_vote,
-                        "BA_DECIDE": bas[idx].handle_decide,
-                    }
-                    h = handlers.get(msg.msg_type)
-                    if h:
-                        await h(msg)
-            await asyncio.sleep(0.001)
+            for msg in await net.receive_batch(idx + 1):
+                h = handlers.get(msg.msg_type)
+                if h:
+                    asyncio.create_task(h(msg))
 
     tasks = [asyncio.create_task(dispatch(i)) for i in range(n)]
     async def run_party(idx):
         try:
-            return await asyncio.wait_for(
-                acss[idx].run(accepted_per_party[idx]), timeout=10.0)
+            async with asyncio.timeout(10.0):
+                return await acss[idx].run(accepted_per_party[idx])
         except asyncio.TimeoutError:
             return None
     results = await asyncio.gather(*[run_party(i) for i in range(n)])
     for t in tasks:
         t.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
     return results
 
 
@@ -16,28 +16,27 @@ async def run_ba_test(inputs, omitting=None, seed=20):
     bas = [BAProtocol(i, n, f, net, beacon) for i in range(1, n + 1)]
 
     async def dispatch(idx):
+        handlers = {"BA_VOTE": bas[idx].handle_vote,
+                    "BA_DECIDE": bas[idx].handle_decide}
         while True:
-            for s in range(1, n + 1):
-                if s == idx + 1:
-                    continue
-                msg = net.channels[(s, idx + 1)].try_receive()
-                if msg:
-                    h = {"BA_VOTE": bas[idx].handle_vote,
-                         "BA_DECIDE": bas[idx].handle_decide}.get(msg.msg_type)
-                    if h:
-                        await h(msg)
-            await asyncio.sleep(0.001)
+            for msg in await net.receive_batch(idx + 1):
+                h = handlers.get(msg.msg_type)
+                if h:
+                    asyncio.create_task(h(msg))
 
     tasks = [asyncio.create_task(dispatch(i)) for i in range(n)]
     async def run_party(idx):
         try:
-            return await asyncio.wait_for(
-                bas[idx].run(ba_key="test", initial_estimate=inputs[idx]), timeout=5.0)
+            async with asyncio.timeout(5.0):
+                return await bas[idx].run(ba_key="test", initial_estimate=inputs[idx])
         except asyncio.TimeoutError:
             return None
-    results = await asyncio.gather(*[run_party(i) for i in range(n)])
+    async with asyncio.TaskGroup() as tg:
+        parties = [tg.create_task(run_party(i)) for i in range(n)]
+    results = [p.result() for p in parties]
     for t in tasks:
         t.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
     return results, beacon
 
 
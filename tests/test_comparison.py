@@ -1,9 +1,11 @@
 """Tests for bit decomposition and comparison circuit."""
 
 import asyncio
+from functools import lru_cache
+import pytest
 from core import rng
-from core.field import FieldElement
-from core.polynomial import Polynomial
+from core.field import FieldElement, party_points
+from core.polynomial import Polynomial, lagrange_coefficients_at_zero
 from sim.network import Network, UniformDelay
 from sim.beacon import RandomnessBeacon
 from protocols.rbc import RBCProtocol
@@ -17,15 +19,27 @@ from circuits.comparison import ComparisonCircuit
 
 def make_sharing(n, f, secret):
     poly = Polynomial.random(f, FieldElement(secret))
-    return [poly.evaluate(FieldElement(i)) for i in range(1, n + 1)]
+    return poly.evaluate_many(party_points(n)[1:])
+
+# Lagrange weights at zero for parties 1 and 2; f=1 needs only two shares
+_W1, _W2 = lagrange_coefficients_at_zero([FieldElement(1), FieldElement(2)])
 
 def reconstruct(shares):
-    pts = [(FieldElement(i + 1), s) for i, s in enumerate(shares)]
-    return Polynomial.interpolate_at_zero(pts[:2])
+    return shares[0] * _W1 + shares[1] * _W2
+
+
+@lru_cache(maxsize=None)
+def _random_bits(n, f, count):
+    """Preprocessed random bit sharings, drawn once per (n, f, count) from
+    their own generator (the global rng is untouched) and shared by every
+    test that asks for them."""
+    return tuple(preprocess_random_bit_sharings(
+        n, f, count, gen=rng.DeterministicRNG(seed=7)))
 
 
 async def setup_full_stack(n=4, f=1, num_random_bits=10):
     """Setup full MPC stack with bit decomposition and comparison."""
+    rbs = _random_bits(n, f, num_random_bits)
     rng.set_seed(42)
     net = Network(n, delay_model=UniformDelay(0.0, 0.002))
     beacon = RandomnessBeacon(threshold=f + 1)
@@ -42,7 +56,6 @@ async def setup_full_stack(n=4, f=1, num_random_bits=10):
                             acs_factory=make_acs)
         mpcs.append(mpc)
 
-    rbs = preprocess_random_bit_sharings(n, f, num_random_bits)
     bd = [BitDecomposition(i, n, f, mpcs[i - 1]) for i in range(1, n + 1)]
     cmp = [ComparisonCircuit(mpcs[i - 1]) for i in range(1, n + 1)]
     for b in bd:
@@ -51,7 +64,7 @@ async def setup_full_stack(n=4, f=1, num_random_bits=10):
     return net, rbcs, bas, csss, mpcs, bd, cmp
 
 
-def start_dispatchers(net, rbcs, bas, csss, mpcs, n=4):
+def start_dispatchers(tg, net, rbcs, bas, csss, mpcs, n=4):
     async def dispatch(idx):
         handlers = {
             "RBC_INIT": rbcs[idx].handle_init,
@@ -65,115 +78,75 @@ def start_dispatchers(net, rbcs, bas, csss, mpcs, n=4):
             "MPC_OPEN": mpcs[idx].handle_open,
         }
         while True:
-            for s in range(1, n + 1):
-                if s == idx + 1:
-                    continue
-                msg = net.channels[(s, idx + 1)].try_receive()
-                if msg and msg.msg_type in handlers:
-                    await handlers[msg.msg_type](msg)
-            await asyncio.sleep(0.001)
-    return [asyncio.create_task(dispatch(i)) for i in range(n)]
+            for msg in await net.receive_batch(idx + 1):
+                if msg.msg_type in handlers:
+                    asyncio.create_task(handlers[msg.msg_type](msg))
+    return [tg.create_task(dispatch(i)) for i in range(n)]
 
 
-def test_bit_decomposition_13():
+@pytest.mark.parametrize("value", [13, 0, 31])
+def test_bit_decomposition(value):
     async def _test():
         net, rbcs, bas, csss, mpcs, bd, cmp = await setup_full_stack(num_random_bits=5)
         for m in mpcs:
             m.set_active_set({1, 2, 3})
-        shares = make_sharing(4, 1, 13)
-        tasks = start_dispatchers(net, rbcs, bas, csss, mpcs)
-        all_bits = await asyncio.gather(*[
-            bd[i].decompose(shares[i], 5, 'bd') for i in range(4)])
-        for t in tasks:
-            t.cancel()
+        shares = make_sharing(4, 1, value)
+        async with asyncio.TaskGroup() as tg:
+            tasks = start_dispatchers(tg, net, rbcs, bas, csss, mpcs)
+            runs = [tg.create_task(bd[i].decompose(shares[i], 5, 'bd'))
+                    for i in range(4)]
+            all_bits = await asyncio.gather(*runs)
+            for t in tasks:
+                t.cancel()
         for b in range(5):
             val = reconstruct([all_bits[i][b] for i in range(4)])
-            assert val.to_int() == (13 >> b) & 1
-    asyncio.run(_test())
-
-def test_bit_decomposition_0():
-    async def _test():
-        net, rbcs, bas, csss, mpcs, bd, cmp = await setup_full_stack(num_random_bits=5)
-        for m in mpcs:
-            m.set_active_set({1, 2, 3})
-        shares = make_sharing(4, 1, 0)
-        tasks = start_dispatchers(net, rbcs, bas, csss, mpcs)
-        all_bits = await asyncio.gather(*[
-            bd[i].decompose(shares[i], 5, 'bd') for i in range(4)])
-        for t in tasks:
-            t.cancel()
-        for b in range(5):
-            assert reconstruct([all_bits[i][b] for i in range(4)]).to_int() == 0
+            assert val.to_int() == (value >> b) & 1
     asyncio.run(_test())
 
-def test_bit_decomposition_31():
-    async def _test():
-        net, rbcs, bas, csss, mpcs, bd, cmp = await setup_full_stack(num_random_bits=5)
-        for m in mpcs:
-            m.set_active_set({1, 2, 3})
-        shares = make_sharing(4, 1, 31)
-        tasks = start_dispatchers(net, rbcs, bas, csss, mpcs)
-        all_bits = await asyncio.gather(*[
-            bd[i].decompose(shares[i], 5, 'bd') for i in range(4)])
-        for t in tasks:
-            t.cancel()
-        for b in range(5):
-            assert reconstruct([all_bits[i][b] for i in range(4)]).to_int() == (31 >> b) & 1
-    asyncio.run(_test())
+# (a, b, expected [a > b])
+COMPARISON_CASES = [(20, 13, 1), (5, 20, 0), (15, 15, 0)]
 
-def test_comparison_20_gt_13():
-    async def _test():
-        net, rbcs, bas, csss, mpcs, bd, cmp = await setup_full_stack(num_random_bits=10)
-        for m in mpcs:
-            m.set_active_set({1, 2, 3})
-        shares_a = make_sharing(4, 1, 20)
-        shares_b = make_sharing(4, 1, 13)
-        tasks = start_dispatchers(net, rbcs, bas, csss, mpcs)
-        async def work(idx):
-            bits_a = await bd[idx].decompose(shares_a[idx], 5, 'a')
-            bits_b = await bd[idx].decompose(shares_b[idx], 5, 'b')
-            return await cmp[idx].greater_than(
-                list(reversed(bits_a)), list(reversed(bits_b)), 'cmp')
-        results = await asyncio.gather(*[work(i) for i in range(4)])
-        for t in tasks:
-            t.cancel()
-        assert reconstruct(results).to_int() == 1
-    asyncio.run(_test())
+# Two 5-bit decompositions per case
+BITS_PER_CASE = 10
 
-def test_comparison_5_not_gt_20():
-    async def _test():
-        net, rbcs, bas, csss, mpcs, bd, cmp = await setup_full_stack(num_random_bits=10)
-        for m in mpcs:
-            m.set_active_set({1, 2, 3})
-        shares_a = make_sharing(4, 1, 5)
-        shares_b = make_sharing(4, 1, 20)
-        tasks = start_dispatchers(net, rbcs, bas, csss, mpcs)
-        async def work(idx):
-            bits_a = await bd[idx].decompose(shares_a[idx], 5, 'a')
-            bits_b = await bd[idx].decompose(shares_b[idx], 5, 'b')
-            return await cmp[idx].greater_than(
-                list(reversed(bits_a)), list(reversed(bits_b)), 'cmp')
-        results = await asyncio.gather(*[work(i) for i in range(4)])
-        for t in tasks:
-            t.cancel()
-        assert reconstruct(results).to_int() == 0
-    asyncio.run(_test())
 
-def test_comparison_equal_is_not_gt():
+def test_comparisons():
+    """All cases run concurrently on one stack, each with its own random
+    bits and session tags."""
     async def _test():
-        net, rbcs, bas, csss, mpcs, bd, cmp = await setup_full_stack(num_random_bits=10)
+        net, rbcs, bas, csss, mpcs, _, cmp = await setup_full_stack(num_random_bits=0)
         for m in mpcs:
             m.set_active_set({1, 2, 3})
-        shares_a = make_sharing(4, 1, 15)
-        shares_b = make_sharing(4, 1, 15)
-        tasks = start_dispatchers(net, rbcs, bas, csss, mpcs)
-        async def work(idx):
-            bits_a = await bd[idx].decompose(shares_a[idx], 5, 'a')
-            bits_b = await bd[idx].decompose(shares_b[idx], 5, 'b')
-            return await cmp[idx].greater_than(
-                list(reversed(bits_a)), list(reversed(bits_b)), 'cmp')
-        results = await asyncio.gather(*[work(i) for i in range(4)])
-        for t in tasks:
-            t.cancel()
-        assert reconstruct(results).to_int() == 0
+        all_rbs = _random_bits(4, 1, BITS_PER_CASE * len(COMPARISON_CASES))
+
+        async def run_case(case, a, b):
+            # Separate BitDecomposition objects per case, each loaded with
+            # its own slice of the cached bits: each party must consume the
+            # same random bits for the same session
+            rbs = all_rbs[case * BITS_PER_CASE:(case + 1) * BITS_PER_CASE]
+            bd = [BitDecomposition(i, 4, 1, mpcs[i - 1]) for i in range(1, 5)]
+            for d in bd:
+                d.load_random_bits(rbs)
+            shares_a = make_sharing(4, 1, a)
+            shares_b = make_sharing(4, 1, b)
+
+            async def work(idx):
+                bits_a = await bd[idx].decompose(shares_a[idx], 5, f'{case}:a')
+                bits_b = await bd[idx].decompose(shares_b[idx], 5, f'{case}:b')
+                # decompose yields LSB-first; greater_than wants MSB-first
+                return await cmp[idx].greater_than(
+                    bits_a[::-1], bits_b[::-1], f'{case}:cmp')
+            async with asyncio.TaskGroup() as tg:
+                parties = [tg.create_task(work(i)) for i in range(4)]
+            return [p.result() for p in parties]
+
+        async with asyncio.TaskGroup() as tg:
+            tasks = start_dispatchers(tg, net, rbcs, bas, csss, mpcs)
+            runs = [tg.create_task(run_case(case, a, b))
+                    for case, (a, b, _) in enumerate(COMPARISON_CASES)]
+            await asyncio.gather(*runs)
+            for t in tasks:
+                t.cancel()
+        for run, (a, b, expected) in zip(runs, COMPARISON_CASES):
+            assert reconstruct(run.result()).to_int() == expected, f"{a} > {b}"
     asyncio.run(_test())
@@ -17,29 +17,25 @@ async def run_css_test(n, f, secret_val, omitting=None, seed=50):
 
     async def dispatch(idx):
         c = css[idx]
+        handlers = {
+            'CSS_SHARE': c.handle_share,
+            'CSS_ECHO': c.handle_echo,
+            'CSS_READY': c.handle_ready,
+            'CSS_RECOVER': c.handle_recover,
+        }
         while True:
-            for s in range(1, n + 1):
-                if s == idx + 1:
-                    continue
-                ch = net.channels[(s, idx + 1)]
-                msg = ch.try_receive()
-                if msg:
-                    handler = {
-                        'CSS_SHARE': c.handle_share,
-                        'CSS_ECHO': c.handle_echo,
-                        'CSS_READY': c.handle_ready,
-                        'CSS_RECOVER': c.handle_recover,
-                    }.get(msg.msg_type)
-                    if handler:
-                        await handler(msg)
-            await asyncio.sleep(0.001)
+            for msg in await net.receive_batch(idx + 1):
+                handler = handlers.get(msg.msg_type)
+                if handler:
+                    asyncio.create_task(handler(msg))
 
     tasks = [asyncio.create_task(dispatch(i)) for i in range(n)]
     await css[0].share(secret, 'test')
     accepted = []
     for c in css:
         try:
-            await asyncio.wait_for(c.wait_accepted('test'), timeout=2.0)
+            async with asyncio.timeout(2.0):
+                await c.wait_accepted('test')
             accepted.append(c.party_id)
         except asyncio.TimeoutError:
             pass
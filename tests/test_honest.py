@@ -1,4 +1,9 @@
-"""Multiple honest execution tests with different configs and seeds."""
+"""Multiple honest execution tests with different configs and seeds.
+
+Each test seeds the RNG and builds its own network and parties inside its
+own event loop, so the tests share no state and can run in any order or
+in separate worker processes (e.g. pytest -n auto with pytest-xdist).
+"""
 
 import asyncio
 from tests.utils import run_auction_test, assert_correctness
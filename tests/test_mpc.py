@@ -2,8 +2,8 @@
 
 import asyncio
 from core import rng
-from core.field import FieldElement
-from core.polynomial import Polynomial
+from core.field import FieldElement, party_points
+from core.polynomial import Polynomial, lagrange_coefficients_at_zero
 from sim.network import Network, UniformDelay
 from sim.beacon import RandomnessBeacon
 from protocols.rbc import RBCProtocol
@@ -15,11 +15,13 @@ from protocols.mpc_arithmetic import MPCArithmetic
 
 def make_sharing(n, f, secret):
     poly = Polynomial.random(f, FieldElement(secret))
-    return [poly.evaluate(FieldElement(i)) for i in range(1, n + 1)]
+    return poly.evaluate_many(party_points(n)[1:])
+
+# Lagrange weights at zero for parties 1 and 2; f=1 needs only two shares
+_W1, _W2 = lagrange_coefficients_at_zero([FieldElement(1), FieldElement(2)])
 
 def reconstruct(shares):
-    pts = [(FieldElement(i + 1), s) for i, s in enumerate(shares)]
-    return Polynomial.interpolate_at_zero(pts[:2])
+    return shares[0] * _W1 + shares[1] * _W2
 
 
 def setup_mpc_stack(n=4, f=1):
@@ -43,8 +45,8 @@ def setup_mpc_stack(n=4, f=1):
     return net, beacon, rbcs, bas, csss, mpcs
 
 
-def start_full_dispatchers(net, rbcs, bas, csss, mpcs, n=4):
-    """Start dispatchers that handle ALL message types."""
+def start_full_dispatchers(tg, net, rbcs, bas, csss, mpcs, n=4):
+    """Start dispatchers that handle ALL message types in task group tg."""
     async def dispatch(idx):
         handlers = {
             "RBC_INIT": rbcs[idx].handle_init,
@@ -58,15 +60,10 @@ def start_full_dispatchers(net, rbcs, bas, csss, mpcs, n=4):
             "MPC_OPEN": mpcs[idx].handle_open,
         }
         while True:
-            for s in range(1, n + 1):
-                if s == idx + 1:
-                    continue
-                ch = net.channels[(s, idx + 1)]
-                msg = ch.try_receive()
-                if msg and msg.msg_type in handlers:
-                    await handlers[msg.msg_type](msg)
-            await asyncio.sleep(0.001)
-    return [asyncio.create_task(dispatch(i)) for i in range(n)]
+            for msg in await net.receive_batch(idx + 1):
+                if msg.msg_type in handlers:
+                    asyncio.create_task(handlers[msg.msg_type](msg))
+    return [tg.create_task(dispatch(i)) for i in range(n)]
 
 
 def test_add_shares():
@@ -97,12 +94,13 @@ def test_multiply_basic():
             m.set_active_set(active)
         shares_a = make_sharing(4, 1, 5)
         shares_b = make_sharing(4, 1, 7)
-        tasks = start_full_dispatchers(net, rbcs, bas, csss, mpcs)
-        results = await asyncio.gather(*[
-            mpcs[i].multiply(shares_a[i], shares_b[i], 'test_mul')
-            for i in range(4)])
-        for t in tasks:
-            t.cancel()
+        async with asyncio.TaskGroup() as tg:
+            tasks = start_full_dispatchers(tg, net, rbcs, bas, csss, mpcs)
+            results = await asyncio.gather(*[
+                mpcs[i].multiply(shares_a[i], shares_b[i], 'test_mul')
+                for i in range(4)])
+            for t in tasks:
+                t.cancel()
         product = reconstruct(results)
         assert product == 35
     asyncio.run(_test())
@@ -114,12 +112,13 @@ def test_multiply_by_zero():
             m.set_active_set({1, 2, 3})
         shares_a = make_sharing(4, 1, 0)
         shares_b = make_sharing(4, 1, 13)
-        tasks = start_full_dispatchers(net, rbcs, bas, csss, mpcs)
-        results = await asyncio.gather(*[
-            mpcs[i].multiply(shares_a[i], shares_b[i], 'test_mul0')
-            for i in range(4)])
-        for t in tasks:
-            t.cancel()
+        async with asyncio.TaskGroup() as tg:
+            tasks = start_full_dispatchers(tg, net, rbcs, bas, csss, mpcs)
+            results = await asyncio.gather(*[
+                mpcs[i].multiply(shares_a[i], shares_b[i], 'test_mul0')
+                for i in range(4)])
+            for t in tasks:
+                t.cancel()
         assert reconstruct(results) == 0
     asyncio.run(_test())
 
@@ -130,12 +129,13 @@ def test_multiply_by_one():
             m.set_active_set({1, 2, 3})
         shares_a = make_sharing(4, 1, 1)
         shares_b = make_sharing(4, 1, 25)
-        tasks = start_full_dispatchers(net, rbcs, bas, csss, mpcs)
-        results = await asyncio.gather(*[
-            mpcs[i].multiply(shares_a[i], shares_b[i], 'test_mul1')
-            for i in range(4)])
-        for t in tasks:
-            t.cancel()
+        async with asyncio.TaskGroup() as tg:
+            tasks = start_full_dispatchers(tg, net, rbcs, bas, csss, mpcs)
+            results = await asyncio.gather(*[
+                mpcs[i].multiply(shares_a[i], shares_b[i], 'test_mul1')
+                for i in range(4)])
+            for t in tasks:
+                t.cancel()
         assert reconstruct(results) == 25
     asyncio.run(_test())
 
@@ -146,15 +146,35 @@ def test_multiply_large():
             m.set_active_set({1, 2, 3})
         shares_a = make_sharing(4, 1, 31)
         shares_b = make_sharing(4, 1, 30)
-        tasks = start_full_dispatchers(net, rbcs, bas, csss, mpcs)
-        results = await asyncio.gather(*[
-            mpcs[i].multiply(shares_a[i], shares_b[i], 'test_mull')
-            for i in range(4)])
-        for t in tasks:
-            t.cancel()
+        async with asyncio.TaskGroup() as tg:
+            tasks = start_full_dispatchers(tg, net, rbcs, bas, csss, mpcs)
+            results = await asyncio.gather(*[
+                mpcs[i].multiply(shares_a[i], shares_b[i], 'test_mull')
+                for i in range(4)])
+            for t in tasks:
+                t.cancel()
         assert reconstruct(results) == 930
     asyncio.run(_test())
 
+def test_multiply_batch():
+    async def _test():
+        net, beacon, rbcs, bas, csss, mpcs = setup_mpc_stack()
+        for m in mpcs:
+            m.set_active_set({1, 2, 3})
+        cases = [(5, 7), (0, 13), (31, 30)]
+        sharings = [(make_sharing(4, 1, a), make_sharing(4, 1, b)) for a, b in cases]
+        async with asyncio.TaskGroup() as tg:
+            tasks = start_full_dispatchers(tg, net, rbcs, bas, csss, mpcs)
+            results = await asyncio.gather(*[
+                mpcs[i].multiply_batch(
+                    [(sa[i], sb[i]) for sa, sb in sharings], 'test_batch')
+                for i in range(4)])
+            for t in tasks:
+                t.cancel()
+        for g, (a, b) in enumerate(cases):
+            assert reconstruct([results[i][g] for i in range(4)]) == a * b
+    asyncio.run(_test())
+
 def test_open_value():
     async def _test():
         rng.set_seed(42)
@@ -164,19 +184,16 @@ def test_open_value():
 
         async def dispatch(idx):
             while True:
-                for s in range(1, 5):
-                    if s == idx + 1:
-                        continue
-                    msg = net.channels[(s, idx + 1)].try_receive()
-                    if msg and msg.msg_type == 'MPC_OPEN':
-                        await mpcs[idx].handle_open(msg)
-                await asyncio.sleep(0.001)
-
-        tasks = [asyncio.create_task(dispatch(i)) for i in range(4)]
-        results = await asyncio.gather(*[
-            mpcs[i].open_value(shares[i], 'open_test') for i in range(4)])
-        for t in tasks:
-            t.cancel()
+                for msg in await net.receive_batch(idx + 1):
+                    if msg.msg_type == 'MPC_OPEN':
+                        asyncio.create_task(mpcs[idx].handle_open(msg))
+
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(dispatch(i)) for i in range(4)]
+            results = await asyncio.gather(*[
+                mpcs[i].open_value(shares[i], 'open_test') for i in range(4)])
+            for t in tasks:
+                t.cancel()
         for r in results:
             assert r == 42
     asyncio.run(_test())
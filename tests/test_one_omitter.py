@@ -6,32 +6,16 @@ and all multiplications complete correctly.
 """
 
 import asyncio
+import pytest
 from sim.network import DropAll
 from tests.utils import run_auction_test, assert_correctness
 
 
-def test_omit_party1():
+@pytest.mark.parametrize("party,seed", [(1, 300), (2, 301), (3, 302), (4, 303)])
+def test_omit_party(party, seed):
     async def _test():
-        results, _, _ = await run_auction_test([5, 20, 13, 7], omitting_party=1, seed=300)
-        assert_correctness(results, [5, 20, 13, 7], omitting_party=1)
-    asyncio.run(_test())
-
-def test_omit_party2():
-    async def _test():
-        results, _, _ = await run_auction_test([5, 20, 13, 7], omitting_party=2, seed=301)
-        assert_correctness(results, [5, 20, 13, 7], omitting_party=2)
-    asyncio.run(_test())
-
-def test_omit_party3():
-    async def _test():
-        results, _, _ = await run_auction_test([5, 20, 13, 7], omitting_party=3, seed=302)
-        assert_correctness(results, [5, 20, 13, 7], omitting_party=3)
-    asyncio.run(_test())
-
-def test_omit_party4():
-    async def _test():
-        results, _, _ = await run_auction_test([5, 20, 13, 7], omitting_party=4, seed=303)
-        assert_correctness(results, [5, 20, 13, 7], omitting_party=4)
+        results, _, _ = await run_auction_test([5, 20, 13, 7], omitting_party=party, seed=seed)
+        assert_correctness(results, [5, 20, 13, 7], omitting_party=party)
     asyncio.run(_test())
 
 def test_omit_different_bids():
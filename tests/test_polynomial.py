@@ -20,6 +20,11 @@ def test_evaluate_quadratic():
     assert p.evaluate(FieldElement(0)) == 1
     assert p.evaluate(FieldElement(3)) == 10
 
+def test_evaluate_many_matches_evaluate():
+    p = Polynomial.random(degree=3, constant=FieldElement(7))
+    xs = [FieldElement(i) for i in range(0, 6)]
+    assert p.evaluate_many(xs) == [p.evaluate(x) for x in xs]
+
 def test_random_polynomial():
     p = Polynomial.random(degree=1, constant=FieldElement(42))
     assert p.evaluate(FieldElement(0)) == 42
@@ -42,13 +47,15 @@ def test_interpolate_at_zero_degree1_other_points():
 def test_interpolate_at_zero_degree2():
     secret = FieldElement(7)
     p = Polynomial([FieldElement(7), FieldElement(3), FieldElement(5)])
-    pts = [(FieldElement(i), p.evaluate(FieldElement(i))) for i in range(1, 4)]
+    xs = [FieldElement(i) for i in range(1, 4)]
+    pts = list(zip(xs, p.evaluate_many(xs)))
     assert Polynomial.interpolate_at_zero(pts) == secret
 
 def test_interpolate_overdetermined():
     secret = FieldElement(42)
     p = Polynomial.random(degree=1, constant=secret)
-    pts = [(FieldElement(i), p.evaluate(FieldElement(i))) for i in range(1, 5)]
+    xs = [FieldElement(i) for i in range(1, 5)]
+    pts = list(zip(xs, p.evaluate_many(xs)))
     assert Polynomial.interpolate_at_zero(pts) == secret
 
 def test_lagrange_coefficients():
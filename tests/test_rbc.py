@@ -13,30 +13,25 @@ async def run_rbc_test(sender_id, payload, omitting=None):
     rbcs = [RBCProtocol(i, n, f, net) for i in range(1, n + 1)]
 
     async def dispatch(idx):
+        handlers = {"RBC_INIT": rbcs[idx].handle_init,
+                    "RBC_ECHO": rbcs[idx].handle_echo,
+                    "RBC_READY": rbcs[idx].handle_ready}
         while True:
-            for s in range(1, n + 1):
-                if s == idx + 1:
-                    continue
-                ch = net.channels[(s, idx + 1)]
-                msg = ch.try_receive()
-                if msg:
-                    h = {"RBC_INIT": rbcs[idx].handle_init,
-                         "RBC_ECHO": rbcs[idx].handle_echo,
-                         "RBC_READY": rbcs[idx].handle_ready}.get(msg.msg_type)
-                    if h:
-                        await h(msg)
-            await asyncio.sleep(0.001)
+            for msg in await net.receive_batch(idx + 1):
+                h = handlers.get(msg.msg_type)
+                if h:
+                    asyncio.create_task(h(msg))
 
     tasks = [asyncio.create_task(dispatch(i)) for i in range(n)]
     await rbcs[sender_id - 1].broadcast("test_tag", payload)
-    delivered = {}
-    for i in range(n):
+    async def wait_party(idx):
         try:
-            val = await asyncio.wait_for(
-                rbcs[i].wait_deliver(sender_id, "test_tag"), timeout=3.0)
-            delivered[i + 1] = val
+            async with asyncio.timeout(3.0):
+                return await rbcs[idx].wait_deliver(sender_id, "test_tag")
         except asyncio.TimeoutError:
-            delivered[i + 1] = None
+            return None
+    results = await asyncio.gather(*[wait_party(i) for i in range(n)])
+    delivered = dict(zip(range(1, n + 1), results))
     for t in tasks:
         t.cancel()
     return delivered
@@ -12,21 +12,29 @@ from circuits.bit_decomposition import preprocess_random_bit_sharings
 
 
 def preprocess_mask_sharings(n, f, count):
+    points = [FieldElement(i) for i in range(1, n + 1)]
     result = []
     for _ in range(count):
         mask = FieldElement.random()
         poly = Polynomial.random(degree=f, constant=mask)
-        shares = {i: poly.evaluate(FieldElement(i)) for i in range(1, n + 1)}
+        shares = dict(zip(range(1, n + 1), poly.evaluate_many(points)))
         result.append(shares)
     return result
 
 
 def reference_auction(bids, active_parties):
-    """Cleartext oracle: returns (winner_id, second_price)."""
-    active_bids = [(pid, bids[pid - 1]) for pid in active_parties]
-    active_bids.sort(key=lambda x: x[1], reverse=True)
-    winner_id = active_bids[0][0]
-    second_price = active_bids[1][1]
+    """Cleartext oracle: returns (winner_id, second_price).
+
+    Single pass over the active bids; on a tie the first party listed wins
+    and the second price equals the winning bid.
+    """
+    winner_id, top, second_price = None, -1, -1
+    for pid in active_parties:
+        bid = bids[pid - 1]
+        if bid > top:
+            winner_id, top, second_price = pid, bid, top
+        elif bid > second_price:
+            second_price = bid
     return winner_id, second_price
 
 
@@ -49,8 +57,9 @@ async def run_auction_test(bids, omitting_party=None, seed=42,
     parties = [Party(i, n, f, bids[i - 1], net, beacon, rbs, masks,
                      protocol_timeout=protocol_timeout)
                for i in range(1, n + 1)]
-    results = await asyncio.gather(*[p.run() for p in parties])
-    return results, net, beacon
+    async with asyncio.TaskGroup() as tg:
+        runs = [tg.create_task(p.run()) for p in parties]
+    return [r.result() for r in runs], net, beacon
 
 
 def assert_correctness(results, bids, omitting_party=None):